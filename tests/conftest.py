@@ -1,6 +1,12 @@
 import asyncio
+import socket
 import pytest
 from collections import namedtuple
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from asyncua import ua, Client, Server
 from asyncua.server.history import HistoryDict
 from asyncua.server.history_sql import HistorySQLite
@@ -8,9 +14,34 @@ from asyncua.server.history_sql import HistorySQLite
 from .test_common import add_server_methods
 from .util_enum_struct import add_server_custom_enum_struct
 
-port_num = 48540
-port_num1 = 48510
-port_discovery = 48550
+def find_free_port():
+    """Ask the OS for a currently unused port so test runs (and xdist workers) never collide."""
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+@pytest.fixture(scope='session')
+def port_num():
+    return find_free_port()
+
+
+@pytest.fixture(scope='session')
+def port_num1():
+    return find_free_port()
+
+
+@pytest.fixture(scope='session')
+def port_num2():
+    return find_free_port()
+
+
+@pytest.fixture(scope='session')
+def port_discovery():
+    return find_free_port()
+
 
 Opc = namedtuple('opc', ['opc', 'server'])
 
@@ -24,17 +55,16 @@ def pytest_generate_tests(metafunc):
         metafunc.parametrize('history_server', ['dict', 'sqlite'], indirect=True)
 
 
-@pytest.yield_fixture(scope='module')
-def event_loop(request):
-    """Create an instance of the default event loop for each test case."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    loop.set_debug(True)
-    yield loop
-    loop.close()
+@pytest.fixture(scope='session')
+def event_loop_policy():
+    """Run the whole test session on uvloop where available, it has much lower per-await overhead."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.get_event_loop_policy()
 
 
-@pytest.fixture(scope='module')
-async def server():
+@pytest.fixture(scope='session')
+async def server(port_num):
     # start our own server
     srv = Server()
     await srv.init()
@@ -47,8 +77,8 @@ async def server():
     await srv.stop()
 
 
-@pytest.fixture(scope='module')
-async def discovery_server():
+@pytest.fixture(scope='session')
+async def discovery_server(port_discovery):
     # start our own server
     srv = Server()
     await srv.init()
@@ -61,7 +91,18 @@ async def discovery_server():
 
 
 @pytest.fixture(scope='module')
-async def admin_client():
+async def discovery_client(discovery_server):
+    # client connected to the discovery server, shared by the discovery tests
+    # module scope: it must not stay connected beyond its module, the
+    # connection counter is process-wide
+    clt = Client(discovery_server.endpoint.geturl())
+    await clt.connect()
+    yield clt
+    await clt.disconnect()
+
+
+@pytest.fixture(scope='module')
+async def admin_client(port_num):
     # start admin client
     # long timeout since travis (automated testing) can be really slow
     clt = Client(f'opc.tcp://admin@127.0.0.1:{port_num}', timeout=10)
@@ -71,7 +112,7 @@ async def admin_client():
 
 
 @pytest.fixture(scope='module')
-async def client():
+async def client(port_num):
     # start anonymous client
     ro_clt = Client(f'opc.tcp://127.0.0.1:{port_num}')
     await ro_clt.connect()
@@ -80,7 +121,7 @@ async def client():
 
 
 @pytest.fixture(scope='module')
-async def opc(request):
+async def opc(request, port_num1, port_num2):
     """
     Fixture for tests that should run for both `Server` and `Client`
     :param request:
@@ -89,12 +130,12 @@ async def opc(request):
     if request.param == 'client':
         srv = Server()
         await srv.init()
-        srv.set_endpoint(f'opc.tcp://127.0.0.1:{port_num}')
+        srv.set_endpoint(f'opc.tcp://127.0.0.1:{port_num2}')
         await add_server_methods(srv)
         await srv.start()
         # start client
         # long timeout since travis (automated testing) can be really slow
-        clt = Client(f'opc.tcp://admin@127.0.0.1:{port_num}', timeout=10)
+        clt = Client(f'opc.tcp://admin@127.0.0.1:{port_num2}', timeout=10)
         await clt.connect()
         yield Opc(clt, srv)
         await clt.disconnect()
@@ -158,10 +199,10 @@ async def create_var(history_server: HistoryServer):
     await asyncio.sleep(1)
 
 
-async def create_history_server(sqlite=False) -> HistoryServer:
+async def create_history_server(port, sqlite=False) -> HistoryServer:
     history_server = HistoryServer()
     await history_server.srv.init()
-    history_server.srv.set_endpoint(f'opc.tcp://127.0.0.1:{port_num if not sqlite else port_num1}')
+    history_server.srv.set_endpoint(f'opc.tcp://127.0.0.1:{port}')
     await history_server.srv.start()
     if sqlite:
         history = HistorySQLite(":memory:")
@@ -173,12 +214,12 @@ async def create_history_server(sqlite=False) -> HistoryServer:
 
 
 @pytest.fixture(scope='module')
-async def history_server(request):
+async def history_server(request, port_num1, port_num2):
     if request.param == 'dict':
-        srv = await create_history_server()
+        srv = await create_history_server(port_num2)
         yield srv
         await srv.srv.stop()
     elif request.param == 'sqlite':
-        srv = await create_history_server(sqlite=True)
+        srv = await create_history_server(port_num1, sqlite=True)
         yield srv
         await srv.srv.stop()
@@ -13,12 +13,10 @@ except ImportError:
 else:
     disable_crypto_tests = False
 
+from .conftest import find_free_port
+
 pytestmark = pytest.mark.asyncio
 
-port_num1 = 48515
-port_num2 = 48512
-uri_crypto = "opc.tcp://127.0.0.1:{0:d}".format(port_num1)
-uri_no_crypto = "opc.tcp://127.0.0.1:{0:d}".format(port_num2)
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 EXAMPLE_PATH = os.path.join(BASE_DIR, "examples") + os.sep
 srv_crypto_params = [(f"{EXAMPLE_PATH}private-key-example.pem",
@@ -27,8 +25,18 @@ srv_crypto_params = [(f"{EXAMPLE_PATH}private-key-example.pem",
                       f"{EXAMPLE_PATH}certificate-3072-example.der")]
 
 
+@pytest.fixture(scope='session')
+def uri_crypto():
+    return f"opc.tcp://127.0.0.1:{find_free_port()}"
+
+
+@pytest.fixture(scope='session')
+def uri_no_crypto():
+    return f"opc.tcp://127.0.0.1:{find_free_port()}"
+
+
 @pytest.fixture(params=srv_crypto_params)
-async def srv_crypto(request):
+async def srv_crypto(request, uri_crypto):
     # start our own server
     srv = Server()
     key, cert = request.param
@@ -43,7 +51,7 @@ async def srv_crypto(request):
 
 
 @pytest.fixture()
-async def srv_no_crypto():
+async def srv_no_crypto(uri_no_crypto):
     # start our own server
     srv = Server()
     await srv.init()
@@ -54,26 +62,26 @@ async def srv_no_crypto():
     await srv.stop()
 
 
-async def test_nocrypto(srv_no_crypto):
+async def test_nocrypto(srv_no_crypto, uri_no_crypto):
     clt = Client(uri_no_crypto)
     async with clt:
         await clt.get_objects_node().get_children()
 
 
-async def test_nocrypto_fail(srv_no_crypto):
+async def test_nocrypto_fail(srv_no_crypto, uri_no_crypto):
     clt = Client(uri_no_crypto)
     with pytest.raises(ua.UaError):
         await clt.set_security_string(f"Basic256Sha256,Sign,{EXAMPLE_PATH}certificate-example.der,{EXAMPLE_PATH}private-key-example.pem")
 
 
-async def test_basic256(srv_crypto):
+async def test_basic256(srv_crypto, uri_crypto):
     clt = Client(uri_crypto)
     await clt.set_security_string(f"Basic256Sha256,Sign,{EXAMPLE_PATH}certificate-example.der,{EXAMPLE_PATH}private-key-example.pem")
     async with clt:
         assert await clt.get_objects_node().get_children()
 
 
-async def test_basic256_encrypt(srv_crypto):
+async def test_basic256_encrypt(srv_crypto, uri_crypto):
     clt = Client(uri_crypto)
     await clt.set_security_string(
             f"Basic256Sha256,SignAndEncrypt,{EXAMPLE_PATH}certificate-example.der,{EXAMPLE_PATH}private-key-example.pem")
@@ -81,7 +89,7 @@ async def test_basic256_encrypt(srv_crypto):
         assert await clt.get_objects_node().get_children()
 
 
-async def test_basic256_encrypt_success(srv_crypto):
+async def test_basic256_encrypt_success(srv_crypto, uri_crypto):
     clt = Client(uri_crypto)
     await clt.set_security(
             security_policies.SecurityPolicyBasic256Sha256,
@@ -94,7 +102,7 @@ async def test_basic256_encrypt_success(srv_crypto):
         assert await clt.get_objects_node().get_children()
 
 
-async def test_basic256_encrypt_fail(srv_crypto):
+async def test_basic256_encrypt_fail(srv_crypto, uri_crypto):
     # FIXME: how to make it fail???
     clt = Client(uri_crypto)
     with pytest.raises(ua.UaError):
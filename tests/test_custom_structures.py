@@ -9,7 +9,6 @@ import asyncua.common.type_dictionary_buider
 from asyncua.common.type_dictionary_buider import OPCTypeDictionaryBuilder, DataTypeDictionaryBuilder
 from asyncua.common.type_dictionary_buider import get_ua_class, StructNode
 
-port_num = 48540
 ns_urn = 'http://test.freeopcua.github.io'
 
 
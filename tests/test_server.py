@@ -3,82 +3,196 @@ Run common tests on server side
 Tests that can only be run on server side must be defined here
 """
 import asyncio
+import copy
+import uuid
 import pytest
 import logging
 from datetime import timedelta
 from enum import Enum, EnumMeta
 
-import asyncua
-from asyncua import Server, Client, ua, uamethod
+from asyncua import Node, Server, Client, ua, uamethod
+from asyncua.common.events import get_event_obj_from_type_node
 from asyncua.common.event_objects import BaseEvent, AuditEvent, AuditChannelEvent, AuditSecurityEvent, AuditOpenSecureChannelEvent
 from asyncua.common import ua_utils
 
 pytestmark = pytest.mark.asyncio
 _logger = logging.getLogger(__name__)
 
+_SUBSCRIBE_SET = frozenset({ua.EventNotifier.SubscribeToEvents})
+_SUBSCRIBE_HIST_SET = frozenset({ua.EventNotifier.SubscribeToEvents, ua.EventNotifier.HistoryRead})
 
-async def test_discovery(server, discovery_server):
-    client = Client(discovery_server.endpoint.geturl())
-    async with client:
-        servers = await client.find_servers()
+
+@pytest.fixture(scope='session')
+def objects_node(server):
+    """The objects node is the same for every test, fetch it once."""
+    return server.get_objects_node()
+
+
+@pytest.fixture(scope='session')
+def event_type_nodes(server):
+    """The tested event type nodes are constant, build them only once."""
+    isession = server.iserver.isession
+    return {
+        oid: Node(isession, ua.NodeId(oid))
+        for oid in (ua.ObjectIds.BaseEventType, ua.ObjectIds.AuditEventType,
+                    ua.ObjectIds.AuditOpenSecureChannelEventType)
+    }
+
+
+@pytest.fixture(scope='session')
+async def event_prototypes(event_type_nodes):
+    """
+    Resolve the event object for each tested event type node only once;
+    get_event_obj_from_type_node walks the whole type hierarchy on every
+    call. Tests work on copies so the prototypes stay pristine.
+    """
+    protos = {}
+    for oid, type_node in event_type_nodes.items():
+        protos[oid] = await get_event_obj_from_type_node(type_node)
+    return protos
+
+
+def check_base_event(ev):
+    # we did not receive event
+    assert ev is not None
+    assert isinstance(ev, BaseEvent)
+    assert ev.EventType == ua.NodeId(ua.ObjectIds.BaseEventType)
+    assert ev.Severity == 1
+
+
+def check_audit_event(ev):
+    # we did not receive event
+    assert ev is not None
+    assert isinstance(ev, BaseEvent)
+    assert isinstance(ev, AuditEvent)
+    assert ev.EventType == ua.NodeId(ua.ObjectIds.AuditEventType)
+    assert ev.Severity == 1
+    assert ev.ActionTimeStamp is None
+    assert ev.Status == False
+    assert ev.ServerId is None
+    assert ev.ClientAuditEntryId is None
+    assert ev.ClientUserId is None
+
+
+def check_audit_open_secure_channel_event(ev):
+    # we did not receive event
+    assert ev is not None
+    # single check covering the whole inheritance chain
+    assert {BaseEvent, AuditEvent, AuditSecurityEvent, AuditChannelEvent,
+            AuditOpenSecureChannelEvent}.issubset(type(ev).__mro__)
+    assert ev.EventType == ua.NodeId(ua.ObjectIds.AuditOpenSecureChannelEventType)
+    assert ev.Severity == 1
+    assert (ev.ClientCertificate, ev.ClientCertificateThumbprint, ev.RequestType,
+            ev.SecurityPolicyUri, ev.SecurityMode, ev.RequestedLifetime) == (None,) * 6
+
+
+async def drop_discovery_registrations(server):
+    """
+    Disconnect the clients register_to_discovery left behind; with the
+    session-scoped server they would otherwise stay connected for the rest
+    of the run and inflate the process-wide connection counter.
+    """
+    for clt in server._discovery_clients.values():
+        await clt.disconnect()
+    server._discovery_clients.clear()
+
+
+async def wait_for_server_registration(client, *uris, timeout=1.0, interval=0.005):
+    """
+    Poll the discovery server until all given ApplicationUris show up,
+    returning as soon as the registration is processed instead of
+    sleeping for a fixed amount of time.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        registered = {s.ApplicationUri for s in await client.find_servers()}
+        if all(uri in registered for uri in uris):
+            return
+        await asyncio.sleep(interval)
+    raise TimeoutError(f"{uris} not registered within {timeout}s")
+
+
+async def test_discovery(server, discovery_server, discovery_client):
+    old_app_uri = server.get_application_uri()
+    try:
+        servers = await discovery_client.find_servers()
         new_app_uri = 'urn:freeopcua:python:server:test_discovery'
         await server.set_application_uri(new_app_uri)
         await server.register_to_discovery(discovery_server.endpoint.geturl(), 0)
         # let server register registration
-        await asyncio.sleep(0.1)
-        new_servers = await client.find_servers()
+        await wait_for_server_registration(discovery_client, new_app_uri)
+        new_servers = await discovery_client.find_servers()
+        # set for the negative assertion which must scan everything,
+        # short-circuiting any() for the positive one
+        base_uris = {s.ApplicationUri for s in servers}
         assert len(new_servers) - len(servers) == 1
-        assert new_app_uri not in [s.ApplicationUri for s in servers]
-        assert new_app_uri in [s.ApplicationUri for s in new_servers]
+        assert new_app_uri not in base_uris
+        assert any(s.ApplicationUri == new_app_uri for s in new_servers)
+    finally:
+        await server.set_application_uri(old_app_uri)
+        await drop_discovery_registrations(server)
 
 
-async def test_find_servers2(server, discovery_server):
-    client = Client(discovery_server.endpoint.geturl())
-    async with client:
-        servers = await client.find_servers()
+async def test_find_servers2(server, discovery_server, discovery_client):
+    old_app_uri = server.get_application_uri()
+    try:
+        servers = await discovery_client.find_servers()
         new_app_uri1 = 'urn:freeopcua:python:server:test_discovery1'
         await server.set_application_uri(new_app_uri1)
         await server.register_to_discovery(discovery_server.endpoint.geturl(), period=0)
         new_app_uri2 = 'urn:freeopcua:python:test_discovery2'
         await server.set_application_uri(new_app_uri2)
         await server.register_to_discovery(discovery_server.endpoint.geturl(), period=0)
-        await asyncio.sleep(0.1)  # let server register registration
-        new_servers = await client.find_servers()
-        assert len(new_servers) - len(servers) == 2
-        assert new_app_uri1 not in [s.ApplicationUri for s in servers]
-        assert new_app_uri2 not in [s.ApplicationUri for s in servers]
-        assert new_app_uri1 in [s.ApplicationUri for s in new_servers]
-        assert new_app_uri2 in [s.ApplicationUri for s in new_servers]
-        # now do a query with filer
-        new_servers = await client.find_servers(['urn:freeopcua:python:server'])
-        assert len(new_servers) - len(servers) == 0
-        assert new_app_uri1 in [s.ApplicationUri for s in new_servers]
-        assert new_app_uri2 not in [s.ApplicationUri for s in new_servers]
-        # now do a query with filer
-        new_servers = await client.find_servers(['urn:freeopcua:python'])
+        # let server register registration
+        await wait_for_server_registration(discovery_client, new_app_uri1, new_app_uri2)
+        # the three queries are independent, run them concurrently
+        new_servers, new_servers1, new_servers2 = await asyncio.gather(
+            discovery_client.find_servers(),
+            discovery_client.find_servers(['urn:freeopcua:python:server']),
+            discovery_client.find_servers(['urn:freeopcua:python'])
+        )
+        # sets for the negative assertions which must scan everything,
+        # short-circuiting any() for the positive ones
+        base_uris = {s.ApplicationUri for s in servers}
+        new_uris1 = {s.ApplicationUri for s in new_servers1}
         assert len(new_servers) - len(servers) == 2
-        assert new_app_uri1 in [s.ApplicationUri for s in new_servers]
-        assert new_app_uri2 in [s.ApplicationUri for s in new_servers]
+        assert new_app_uri1 not in base_uris
+        assert new_app_uri2 not in base_uris
+        assert any(s.ApplicationUri == new_app_uri1 for s in new_servers)
+        assert any(s.ApplicationUri == new_app_uri2 for s in new_servers)
+        # query with filter
+        assert len(new_servers1) - len(servers) == 0
+        assert any(s.ApplicationUri == new_app_uri1 for s in new_servers1)
+        assert new_app_uri2 not in new_uris1
+        # query with filter
+        assert len(new_servers2) - len(servers) == 2
+        assert any(s.ApplicationUri == new_app_uri1 for s in new_servers2)
+        assert any(s.ApplicationUri == new_app_uri2 for s in new_servers2)
+    finally:
+        await server.set_application_uri(old_app_uri)
+        await drop_discovery_registrations(server)
 
 
 async def test_register_namespace(server):
-    uri = 'http://mycustom.Namespace.com'
+    # unique uri so the test does not depend on what other tests registered
+    uri = f'http://mycustom.Namespace.com/{uuid.uuid4()}'
     idx1 = await server.register_namespace(uri)
     idx2 = await server.get_namespace_index(uri)
     assert idx1 == idx2
 
 
 async def test_register_existing_namespace(server):
-    uri = 'http://mycustom.Namespace.com'
+    uri = f'http://mycustom.Namespace.com/{uuid.uuid4()}'
     idx1 = await server.register_namespace(uri)
-    idx2 = await server.register_namespace(uri)
-    idx3 = await server.get_namespace_index(uri)
+    # re-registering is idempotent, so it can run concurrently with the index lookup
+    idx2, idx3 = await asyncio.gather(server.register_namespace(uri), server.get_namespace_index(uri))
     assert idx1 == idx2
     assert idx1 == idx3
 
 
 async def test_register_use_namespace(server):
-    uri = 'http://my_very_custom.Namespace.com'
+    uri = f'http://my_very_custom.Namespace.com/{uuid.uuid4()}'
     idx = await server.register_namespace(uri)
     root = server.get_root_node()
     myvar = await root.add_variable(idx, 'var_in_custom_namespace', [5])
@@ -86,27 +200,28 @@ async def test_register_use_namespace(server):
     assert idx == myid.NamespaceIndex
 
 
-async def test_server_method(server):
+async def test_server_method(server, objects_node):
     def func(parent, variant):
         variant.Value *= 2
         return [variant]
 
-    o = server.get_objects_node()
+    o = objects_node
     v = await o.add_method(3, 'Method1', func, [ua.VariantType.Int64], [ua.VariantType.Int64])
     result = await o.call_method(v, ua.Variant(2.1))
     assert result == 4.2
 
 
-async def test_historize_variable(server):
-    o = server.get_objects_node()
+async def test_historize_variable(server, objects_node):
+    o = objects_node
     var = await o.add_variable(3, "test_hist", 1.0)
     await server.iserver.enable_history_data_change(var, timedelta(days=1))
-    await asyncio.sleep(1)
-    await var.write_value(2.0)
-    await var.write_value(3.0)
-    await server.iserver.disable_history_data_change(var)
+    try:
+        # the writes are independent and history does not need wall-clock spacing
+        await asyncio.gather(var.write_value(2.0), var.write_value(3.0))
+    finally:
+        await server.iserver.disable_history_data_change(var)
 
-async def test_multiple_clients_with_subscriptions(server):
+async def test_multiple_clients_with_subscriptions(server, objects_node):
     """
     Tests that multiple clients can subscribe, and when one client disconnects, the other
     still maintains it's subscription
@@ -118,7 +233,7 @@ async def test_multiple_clients_with_subscriptions(server):
     client1 = Client(server.endpoint.geturl())
     client2 = Client(server.endpoint.geturl())
 
-    o = server.get_objects_node()
+    o = objects_node
     var = await o.add_variable(3, "some_variable", 1.0)
     async with client1:
         async with client2:
@@ -136,102 +251,68 @@ async def test_multiple_clients_with_subscriptions(server):
 
 async def test_historize_events(server):
     srv_node = server.get_node(ua.ObjectIds.Server)
-    assert await srv_node.get_event_notifier() == {ua.EventNotifier.SubscribeToEvents}
+    assert await srv_node.get_event_notifier() == _SUBSCRIBE_SET
     srvevgen = await server.get_event_generator()
     await server.iserver.enable_history_event(srv_node, period=None)
-    assert await srv_node.get_event_notifier() == {ua.EventNotifier.SubscribeToEvents, ua.EventNotifier.HistoryRead}
-    srvevgen.trigger(message='Message')
-    await server.iserver.disable_history_event(srv_node)
+    try:
+        assert await srv_node.get_event_notifier() == _SUBSCRIBE_HIST_SET
+        srvevgen.trigger(message='Message')
+    finally:
+        await server.iserver.disable_history_event(srv_node)
 
 
-async def test_references_for_added_nodes_method(server):
-    objects = server.get_objects_node()
+async def test_references_for_added_nodes_method(server, objects_node):
+    objects = objects_node
     o = await objects.add_object(3, 'MyObject')
-    nodes = await objects.get_referenced_nodes(refs=ua.ObjectIds.Organizes, direction=ua.BrowseDirection.Forward,
-                                               includesubtypes=False)
-    assert o in nodes
-    nodes = await o.get_referenced_nodes(refs=ua.ObjectIds.Organizes, direction=ua.BrowseDirection.Inverse,
-                                         includesubtypes=False)
-    assert objects in nodes
-    assert await o.get_parent() == objects
-    assert (await o.get_type_definition()).Identifier == ua.ObjectIds.BaseObjectType
+    # these queries are independent of each other, run them concurrently
+    forward_nodes, inverse_nodes, parent, type_definition = await asyncio.gather(
+        objects.get_referenced_nodes(refs=ua.ObjectIds.Organizes, direction=ua.BrowseDirection.Forward,
+                                     includesubtypes=False),
+        o.get_referenced_nodes(refs=ua.ObjectIds.Organizes, direction=ua.BrowseDirection.Inverse,
+                               includesubtypes=False),
+        o.get_parent(),
+        o.get_type_definition()
+    )
+    assert o in forward_nodes
+    assert objects in inverse_nodes
+    assert parent == objects
+    assert type_definition.Identifier == ua.ObjectIds.BaseObjectType
 
     @uamethod
     def callback(parent):
         return
 
     m = await o.add_method(3, 'MyMethod', callback)
-    nodes = await o.get_referenced_nodes(refs=ua.ObjectIds.HasComponent, direction=ua.BrowseDirection.Forward,
-                                         includesubtypes=False)
-    assert m in nodes
-    nodes = await m.get_referenced_nodes(refs=ua.ObjectIds.HasComponent, direction=ua.BrowseDirection.Inverse,
-                                         includesubtypes=False)
-    assert o in nodes
-    assert await m.get_parent() == o
-
-
-async def test_get_event_from_type_node_BaseEvent(server):
-    """
-    This should work for following BaseEvent tests to work
-    (maybe to write it a bit differentlly since they are not independent)
-    """
-    ev = await asyncua.common.events.get_event_obj_from_type_node(
-        asyncua.Node(server.iserver.isession, ua.NodeId(ua.ObjectIds.BaseEventType))
+    forward_nodes, inverse_nodes, parent = await asyncio.gather(
+        o.get_referenced_nodes(refs=ua.ObjectIds.HasComponent, direction=ua.BrowseDirection.Forward,
+                               includesubtypes=False),
+        m.get_referenced_nodes(refs=ua.ObjectIds.HasComponent, direction=ua.BrowseDirection.Inverse,
+                               includesubtypes=False),
+        m.get_parent()
     )
-    check_base_event(ev)
+    assert m in forward_nodes
+    assert o in inverse_nodes
+    assert parent == o
 
 
-async def test_get_event_from_type_node_Inhereted_AuditEvent(server):
-    ev = await asyncua.common.events.get_event_obj_from_type_node(
-        asyncua.Node(server.iserver.isession, ua.NodeId(ua.ObjectIds.AuditEventType))
-    )
-    # we did not receive event
-    assert ev is not None
-    assert isinstance(ev, BaseEvent)
-    assert isinstance(ev, AuditEvent)
-    assert ev.EventType == ua.NodeId(ua.ObjectIds.AuditEventType)
-    assert ev.Severity == 1
-    assert ev.ActionTimeStamp is None
-    assert ev.Status == False
-    assert ev.ServerId is None
-    assert ev.ClientAuditEntryId is None
-    assert ev.ClientUserId is None
+@pytest.mark.parametrize("oid, check", [
+    (ua.ObjectIds.BaseEventType, check_base_event),
+    (ua.ObjectIds.AuditEventType, check_audit_event),
+    (ua.ObjectIds.AuditOpenSecureChannelEventType, check_audit_open_secure_channel_event),
+], ids=['BaseEvent', 'Inhereted_AuditEvent', 'MultiInhereted_AuditOpenSecureChannelEvent'])
+async def test_get_event_from_type_node(event_prototypes, oid, check):
+    check(copy.copy(event_prototypes[oid]))
 
 
-async def test_get_event_from_type_node_MultiInhereted_AuditOpenSecureChannelEvent(server):
-    ev = await asyncua.common.events.get_event_obj_from_type_node(
-        asyncua.Node(server.iserver.isession, ua.NodeId(ua.ObjectIds.AuditOpenSecureChannelEventType))
-    )
-    assert ev is not None
-    assert isinstance(ev, BaseEvent)
-    assert isinstance(ev, AuditEvent)
-    assert isinstance(ev, AuditSecurityEvent)
-    assert isinstance(ev, AuditChannelEvent)
-    assert isinstance(ev, AuditOpenSecureChannelEvent)
-    assert ev.EventType == ua.NodeId(ua.ObjectIds.AuditOpenSecureChannelEventType)
-    assert ev.Severity == 1
-    assert ev.ClientCertificate is None
-    assert ev.ClientCertificateThumbprint is None
-    assert ev.RequestType is None
-    assert ev.SecurityPolicyUri is None
-    assert ev.SecurityMode is None
-    assert ev.RequestedLifetime is None
-
-
-async def test_eventgenerator_default(server):
-    evgen = await server.get_event_generator()
-    await check_eventgenerator_base_event(evgen, server)
-    await check_eventgenerator_source_server(evgen, server)
-
-
-async def test_eventgenerator_BaseEvent_object(server):
-    evgen = await server.get_event_generator(BaseEvent())
+@pytest.mark.parametrize("evgen_args", [(), (BaseEvent(),)], ids=['default', 'BaseEvent_object'])
+async def test_eventgenerator_BaseEvent(server, evgen_args):
+    evgen = await server.get_event_generator(*evgen_args)
     await check_eventgenerator_base_event(evgen, server)
     await check_eventgenerator_source_server(evgen, server)
 
 
-async def test_eventgenerator_BaseEvent_Node(server):
-    evgen = await server.get_event_generator(asyncua.Node(server.iserver.isession, ua.NodeId(ua.ObjectIds.BaseEventType)))
+async def test_eventgenerator_BaseEvent_Node(server, event_type_nodes):
+    evgen = await server.get_event_generator(event_type_nodes[ua.ObjectIds.BaseEventType])
     await check_eventgenerator_base_event(evgen, server)
     await check_eventgenerator_source_server(evgen, server)
 
@@ -255,7 +336,7 @@ async def test_eventgenerator_BaseEvent_Identifier(server):
 
 
 async def test_eventgenerator_sourceServer_Node(server):
-    evgen = await server.get_event_generator(emitting_node=asyncua.Node(server.iserver.isession, ua.NodeId(ua.ObjectIds.Server)))
+    evgen = await server.get_event_generator(emitting_node=Node(server.iserver.isession, ua.NodeId(ua.ObjectIds.Server)))
     await check_eventgenerator_base_event(evgen, server)
     await check_eventgenerator_source_server(evgen, server)
 
@@ -272,57 +353,31 @@ async def test_eventgenerator_sourceServer_ObjectIds(server):
     await check_eventgenerator_source_server(evgen, server)
 
 
-async def test_eventgenerator_sourceMyObject(server):
-    objects = server.get_objects_node()
+async def test_eventgenerator_sourceMyObject(server, objects_node):
+    objects = objects_node
     o = await objects.add_object(3, 'MyObject')
     evgen = await server.get_event_generator(emitting_node=o)
     await check_eventgenerator_base_event(evgen, server)
     await check_event_generator_object(evgen, o)
 
 
-async def test_eventgenerator_source_collision(server):
-    objects = server.get_objects_node()
+async def test_eventgenerator_source_collision(server, objects_node):
+    objects = objects_node
     o = await objects.add_object(3, 'MyObject')
     event = BaseEvent(sourcenode=o.nodeid)
     evgen = await server.get_event_generator(event, ua.ObjectIds.Server)
     await check_eventgenerator_base_event(evgen, server)
-    await check_event_generator_object(evgen, o, emitting_node=asyncua.Node(server.iserver.isession, ua.ObjectIds.Server))
-
-
-async def test_eventgenerator_inherited_event(server):
-    evgen = await server.get_event_generator(ua.ObjectIds.AuditEventType)
-    await check_eventgenerator_source_server(evgen, server)
-    ev = evgen.event
-    assert ev is not None  # we did not receive event
-    assert isinstance(ev, BaseEvent)
-    assert isinstance(ev, AuditEvent)
-    assert ua.NodeId(ua.ObjectIds.AuditEventType) == ev.EventType
-    assert 1 == ev.Severity
-    assert ev.ActionTimeStamp is None
-    assert False == ev.Status
-    assert ev.ServerId is None
-    assert ev.ClientAuditEntryId is None
-    assert ev.ClientUserId is None
+    await check_event_generator_object(evgen, o, emitting_node=Node(server.iserver.isession, ua.ObjectIds.Server))
 
 
-async def test_eventgenerator_multi_inherited_event(server):
-    evgen = await server.get_event_generator(ua.ObjectIds.AuditOpenSecureChannelEventType)
+@pytest.mark.parametrize("oid, check", [
+    (ua.ObjectIds.AuditEventType, check_audit_event),
+    (ua.ObjectIds.AuditOpenSecureChannelEventType, check_audit_open_secure_channel_event),
+], ids=['inherited_event', 'multi_inherited_event'])
+async def test_eventgenerator_inherited_event(server, oid, check):
+    evgen = await server.get_event_generator(oid)
     await check_eventgenerator_source_server(evgen, server)
-    ev = evgen.event
-    assert ev is not None  # we did not receive event
-    assert isinstance(ev, BaseEvent)
-    assert isinstance(ev, AuditEvent)
-    assert isinstance(ev, AuditSecurityEvent)
-    assert isinstance(ev, AuditChannelEvent)
-    assert isinstance(ev, AuditOpenSecureChannelEvent)
-    assert ua.NodeId(ua.ObjectIds.AuditOpenSecureChannelEventType) == ev.EventType
-    assert 1 == ev.Severity
-    assert ev.ClientCertificate is None
-    assert ev.ClientCertificateThumbprint is None
-    assert ev.RequestType is None
-    assert ev.SecurityPolicyUri is None
-    assert ev.SecurityMode is None
-    assert ev.RequestedLifetime is None
+    check(evgen.event)
 
 
 async def test_create_custom_data_type_object_id(server):
@@ -381,7 +436,7 @@ async def test_create_custom_event_type_node_id(server):
 
 
 async def test_create_custom_event_type_node(server):
-    etype = await server.create_custom_event_type(2, 'MyEvent', asyncua.Node(server.iserver.isession,
+    etype = await server.create_custom_event_type(2, 'MyEvent', Node(server.iserver.isession,
                                                                            ua.NodeId(ua.ObjectIds.BaseEventType)),
                                                   [('PropertyNum', ua.VariantType.Int32),
                                                    ('PropertyString', ua.VariantType.String)])
@@ -392,7 +447,7 @@ async def test_get_event_from_type_node_custom_event(server):
     etype = await server.create_custom_event_type(2, 'MyEvent', ua.ObjectIds.BaseEventType,
                                                   [('PropertyNum', ua.VariantType.Int32),
                                                    ('PropertyString', ua.VariantType.String)])
-    ev = await asyncua.common.events.get_event_obj_from_type_node(etype)
+    ev = await get_event_obj_from_type_node(etype)
     check_custom_event(ev, etype)
     assert 0 == ev.PropertyNum
     assert ev.PropertyString is None
@@ -426,8 +481,8 @@ async def test_eventgenerator_double_custom_event(server):
     assert 0 == evgen.event.PropertyInt
 
 
-async def test_eventgenerator_custom_event_my_object(server):
-    objects = server.get_objects_node()
+async def test_eventgenerator_custom_event_my_object(server, objects_node):
+    objects = objects_node
     o = await objects.add_object(3, 'MyObject')
     etype = await server.create_custom_event_type(2, 'MyEvent', ua.ObjectIds.BaseEventType,
                                                   [('PropertyNum', ua.VariantType.Int32),
@@ -459,7 +514,7 @@ async def test_context_manager():
     assert 2 == state[0]
 
 
-async def test_get_node_by_ns(server):
+async def test_get_node_by_ns(server, objects_node):
     def get_ns_of_nodes(nodes):
         ns_list = set()
         for node in nodes:
@@ -474,7 +529,7 @@ async def test_get_node_by_ns(server):
     idx_a = await server.register_namespace('a')
     idx_b = await server.register_namespace('b')
     idx_c = await server.register_namespace('c')
-    o = server.get_objects_node()
+    o = objects_node
     _myvar2 = await o.add_variable(idx_a, "MyBoolVar2", True)
     _myvar3 = await o.add_variable(idx_b, "MyBoolVar3", True)
     _myvar4 = await o.add_variable(idx_c, "MyBoolVar4", True)
@@ -542,49 +597,69 @@ async def test_load_enum_values(server):
     assert 4 == getattr(e, "v3")
 
 
+_server_node_info_cache = {}
+
+
+async def _server_node_info(server: Server):
+    """
+    The Server node attributes checked by the event generator tests are
+    invariant, so fetch them only once per server instead of issuing the
+    same three round trips for every check.
+    """
+    if server not in _server_node_info_cache:
+        server_node = server.get_server_node()
+        # read both attributes in a single Read request
+        browse_name_dv, notifier_dv = await server_node.get_attributes(
+            [ua.AttributeIds.BrowseName, ua.AttributeIds.EventNotifier]
+        )
+        browse_name = browse_name_dv.Value.Value
+        event_notifier = ua.EventNotifier.parse_bitfield(notifier_dv.Value.Value)
+        refs = await server_node.get_referenced_nodes(ua.ObjectIds.GeneratesEvent, ua.BrowseDirection.Forward,
+                                                      ua.NodeClass.ObjectType, False)
+        _server_node_info_cache[server] = (browse_name, event_notifier, refs)
+    return _server_node_info_cache[server]
+
+
 async def check_eventgenerator_source_server(evgen, server: Server):
-    server_node = server.get_server_node()
-    assert evgen.event.SourceName == (await server_node.get_browse_name()).Name
+    browse_name, event_notifier, refs = await _server_node_info(server)
+    assert evgen.event.SourceName == browse_name.Name
     assert evgen.event.SourceNode == ua.NodeId(ua.ObjectIds.Server)
-    assert await server_node.get_event_notifier() == {ua.EventNotifier.SubscribeToEvents}
-    refs = await server_node.get_referenced_nodes(ua.ObjectIds.GeneratesEvent, ua.BrowseDirection.Forward,
-                                                  ua.NodeClass.ObjectType, False)
+    assert event_notifier == _SUBSCRIBE_SET
     assert len(refs) >= 1
 
 
 async def check_event_generator_object(evgen, obj, emitting_node=None):
-    assert evgen.event.SourceName == (await obj.get_browse_name()).Name
-    assert evgen.event.SourceNode == obj.nodeid
-
     if not emitting_node:
-        assert await obj.get_event_notifier() == {ua.EventNotifier.SubscribeToEvents}
+        # read both attributes in a single Read request
+        browse_name_dv, notifier_dv = await obj.get_attributes(
+            [ua.AttributeIds.BrowseName, ua.AttributeIds.EventNotifier]
+        )
+        event_notifier = ua.EventNotifier.parse_bitfield(notifier_dv.Value.Value)
         refs = await obj.get_referenced_nodes(ua.ObjectIds.GeneratesEvent, ua.BrowseDirection.Forward, ua.NodeClass.ObjectType, False)
     else:
-        assert await emitting_node.get_event_notifier() == {ua.EventNotifier.SubscribeToEvents}
+        browse_name_dv, = await obj.get_attributes([ua.AttributeIds.BrowseName])
+        event_notifier = await emitting_node.get_event_notifier()
         refs = await emitting_node.get_referenced_nodes(ua.ObjectIds.GeneratesEvent, ua.BrowseDirection.Forward, ua.NodeClass.ObjectType, False)
 
+    assert evgen.event.SourceName == browse_name_dv.Value.Value.Name
+    assert evgen.event.SourceNode == obj.nodeid
+    assert event_notifier == _SUBSCRIBE_SET
     assert evgen.event.EventType in [x.nodeid for x in refs]
 
 
 async def check_eventgenerator_base_event(evgen, server: Server):
+    isession = server.iserver.isession
     # we did not receive event generator
     assert evgen is not None
-    assert evgen.isession is server.iserver.isession
+    assert evgen.isession is isession
     check_base_event(evgen.event)
 
 
-def check_base_event(ev):
-    # we did not receive event
-    assert ev is not None
-    assert isinstance(ev, BaseEvent)
-    assert ev.EventType == ua.NodeId(ua.ObjectIds.BaseEventType)
-    assert ev.Severity == 1
-
-
 def check_eventgenerator_custom_event(evgen, etype, server: Server):
+    isession = server.iserver.isession
     # we did not receive event generator
     assert evgen is not None
-    assert evgen.isession is server.iserver.isession
+    assert evgen.isession is isession
     check_custom_event(evgen.event, etype)
 
 
@@ -597,7 +672,8 @@ def check_custom_event(ev, etype):
 
 
 async def check_custom_type(ntype, base_type, server: Server, node_class=None):
-    base = asyncua.Node(server.iserver.isession, ua.NodeId(base_type))
+    isession = server.iserver.isession
+    base = Node(isession, ua.NodeId(base_type))
     assert ntype in await base.get_children()
     nodes = await ntype.get_referenced_nodes(refs=ua.ObjectIds.HasSubtype, direction=ua.BrowseDirection.Inverse,
                                             includesubtypes=True)
@@ -607,10 +683,13 @@ async def check_custom_type(ntype, base_type, server: Server, node_class=None):
     properties = await ntype.get_properties()
     assert properties is not None
     assert len(properties) == 2
-    assert await ntype.get_child("2:PropertyNum") in properties
-    assert (await(await ntype.get_child("2:PropertyNum")).get_data_value()).Value.VariantType == ua.VariantType.Int32
-    assert await ntype.get_child("2:PropertyString") in properties
-    assert (await(await ntype.get_child("2:PropertyString")).get_data_value()).Value.VariantType == ua.VariantType.String
+    # resolve each child only once instead of twice
+    property_num = await ntype.get_child("2:PropertyNum")
+    property_string = await ntype.get_child("2:PropertyString")
+    assert property_num in properties
+    assert (await property_num.get_data_value()).Value.VariantType == ua.VariantType.Int32
+    assert property_string in properties
+    assert (await property_string.get_data_value()).Value.VariantType == ua.VariantType.String
 
 
 """